@@ -1,17 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
+import sys
+import zlib
 import subprocess
-import whisper
 import tempfile
 import csv
 import threading
-from datetime import datetime
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from abc import ABC, abstractmethod
 import pandas as pd
+import numpy as np
 import re
 import requests
 from bs4 import BeautifulSoup
 import json
+import gzip
+import hashlib
+import time
+import sqlite3
 
 # Try to import optional packages with fallbacks
 try:
@@ -36,6 +45,635 @@ except ImportError:
     ISODATE_AVAILABLE = False
     print("isodate not installed. Duration parsing may be limited.")
 
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+    print("openai-whisper not installed. PyTorch Whisper backend unavailable.")
+
+try:
+    from faster_whisper import WhisperModel, decode_audio
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+    print("faster-whisper not installed. Quantized CPU transcription unavailable.")
+
+try:
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    SILERO_VAD_AVAILABLE = True
+except ImportError:
+    SILERO_VAD_AVAILABLE = False
+
+# Channel tabs walked by the web listing when Shorts & Live are included
+LISTING_TABS = ('videos', 'shorts', 'streams')
+
+# Transcripts are stored truncated to this many characters
+TRANSCRIPT_MAX_CHARS = 5000
+
+# Caption languages to look for, in order of preference
+DEFAULT_CAPTION_LANGUAGES = ['en', 'en-US', 'en-GB']
+
+# Caption lookup errors that mean the video has no captions (cacheable),
+# as opposed to network or playability failures worth retrying next run
+NO_CAPTION_EXCEPTIONS = ('TranscriptsDisabled', 'NoTranscriptFound')
+
+# Whisper gating: skip videos longer than this (seconds), silent clips, and
+# clips where speech covers less than MIN_SPEECH_RATIO of the audio
+WHISPER_MAX_DURATION = 20 * 60
+MIN_SPEECH_SECONDS = 1.0
+MIN_SPEECH_RATIO = 0.15
+SPEECH_ENERGY_THRESHOLD = 0.01  # RMS, for audio in [-1, 1]
+WHISPER_NO_SPEECH_PROB = 0.6  # segments above this count as non-speech
+
+# Whisper output that is not speech, e.g. "♪♪", "[Music]", "(applause)"
+NON_SPEECH_TEXT = re.compile(r'[\W_]|\b(music|applause|laughter|silence)\b', re.IGNORECASE)
+
+# Whisper model tiers, smallest first. A transcript below the confidence
+# threshold is redone with the next tier.
+WHISPER_MODEL_TIERS = ['tiny', 'base', 'small']
+WHISPER_MIN_CONFIDENCE = 0.45  # exp(mean segment avg_logprob)
+WHISPER_LONG_CLIP = 10 * 60  # seconds, long clips stop at the second tier
+
+
+class TranscriptionBackend(ABC):
+    """Base class for the speech-to-text engines behind the Whisper fallback"""
+    name = ""
+    
+    def __init__(self):
+        self.model_name = None
+        self.model = None
+        self.lock = threading.Lock()
+    
+    def get_model(self, model_name):
+        """
+        Load a model, keeping only the last one used in memory. Escalating
+        to the next tier frees the lower one before the larger one loads.
+        """
+        with self.lock:
+            if model_name != self.model_name:
+                self.model_name, self.model = None, None
+                self.model = self.load_model(model_name)
+                self.model_name = model_name
+            return self.model
+    
+    @abstractmethod
+    def load_model(self, model_name):
+        """Load a model by Whisper name, e.g. 'tiny.en'"""
+    
+    @abstractmethod
+    def transcribe(self, audio, model_name, language=None):
+        """Transcribe 16 kHz float32 audio, returns (text, confidence, speech_ratio)"""
+    
+    @staticmethod
+    def speech_ratio(segments, audio_seconds):
+        """
+        Share of the clip covered by segments Whisper considers speech, from
+        (start, end, no_speech_prob, text) tuples. Music-only clips come out
+        near 0: their segments have a high no_speech_prob or only "♪" text.
+        """
+        if audio_seconds <= 0:
+            return 0.0
+        speech = sum(end - start for start, end, no_speech_prob, text in segments
+                     if no_speech_prob < WHISPER_NO_SPEECH_PROB and NON_SPEECH_TEXT.sub('', text))
+        return min(1.0, speech / audio_seconds)
+    
+    @staticmethod
+    def confidence(avg_logprobs):
+        """Map segment log probabilities to a 0-1 confidence"""
+        if not avg_logprobs:
+            return 0.0
+        return float(np.exp(np.mean(avg_logprobs)))
+
+
+class WhisperBackend(TranscriptionBackend):
+    """openai-whisper running on PyTorch CPU"""
+    name = "whisper"
+    
+    def load_model(self, model_name):
+        return whisper.load_model(model_name, device="cpu")
+    
+    def transcribe(self, audio, model_name, language=None):
+        result = self.get_model(model_name).transcribe(audio, language=language, fp16=False)
+        # Keep only what is needed, not the per-segment token data
+        text = result.get('text', '').strip()[:TRANSCRIPT_MAX_CHARS]
+        segments = result.get('segments', [])
+        logprobs = [segment['avg_logprob'] for segment in segments]
+        spans = [(segment['start'], segment['end'], segment['no_speech_prob'], segment['text'])
+                 for segment in segments]
+        del result, segments
+        return text, self.confidence(logprobs), self.speech_ratio(spans, len(audio) / 16000)
+
+
+class FasterWhisperBackend(TranscriptionBackend):
+    """faster-whisper (CTranslate2) with int8 quantized CPU inference"""
+    name = "faster-whisper"
+    compute_type = "int8"
+    
+    def load_model(self, model_name):
+        return WhisperModel(model_name, device="cpu", compute_type=self.compute_type)
+    
+    def transcribe(self, audio, model_name, language=None):
+        segments, _ = self.get_model(model_name).transcribe(audio, language=language, beam_size=1)
+        texts = []
+        logprobs = []
+        spans = []
+        for segment in segments:
+            texts.append(segment.text)
+            logprobs.append(segment.avg_logprob)
+            spans.append((segment.start, segment.end, segment.no_speech_prob, segment.text))
+        return ("".join(texts).strip()[:TRANSCRIPT_MAX_CHARS], self.confidence(logprobs),
+                self.speech_ratio(spans, len(audio) / 16000))
+
+
+TRANSCRIPTION_BACKENDS = {
+    'faster-whisper': (FasterWhisperBackend, FASTER_WHISPER_AVAILABLE),
+    'whisper': (WhisperBackend, WHISPER_AVAILABLE),
+}
+
+# Response cache: lifetime per endpoint (seconds), total size cap and location
+CACHE_TTLS = {
+    'channel_id': 7 * 86400,
+    'channel_videos': 3600,
+    'watch': 6 * 3600,
+    'api_channel': 86400,
+    'api_playlist': 3600,
+    'api_videos': 3600,
+    'captions': 7 * 86400,
+}
+CACHE_MAX_BYTES = 500 * 1024 * 1024
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".youtube_scraper_cache")
+
+
+class CacheMiss(Exception):
+    """Raised in offline mode when a response is not in the cache"""
+
+
+class ResponseCache:
+    """
+    Gzip-compressed on-disk cache of HTTP and Data API responses.
+    Entries expire per endpoint (CACHE_TTLS) and the least recently used
+    ones are evicted once the cache grows past max_bytes. In offline mode
+    expired entries are still served and nothing is fetched.
+    """
+    
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, offline=False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(os.path.getsize(path) for path in self.entries())
+    
+    def entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.gz'):
+                    yield os.path.join(root, name)
+    
+    def path_for(self, endpoint, key):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, endpoint, digest + '.gz')
+    
+    def get(self, endpoint, key):
+        """Cached text for key, or None if missing or expired"""
+        path = self.path_for(endpoint, key)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if not self.offline and age > CACHE_TTLS.get(endpoint, 3600):
+                return None
+            with open(path, 'rb') as f:
+                text = gzip.decompress(f.read()).decode('utf-8')
+            # Mark as recently used for eviction, keeping the age intact
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+            return text
+        except (OSError, EOFError):
+            return None
+    
+    def put(self, endpoint, key, text):
+        path = self.path_for(endpoint, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = gzip.compress(text.encode('utf-8'), compresslevel=6)
+        
+        with self.lock:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self.size += len(data) - old_size
+            if self.size > self.max_bytes:
+                self.evict()
+    
+    def evict(self):
+        """Delete least recently used entries until 90% of max_bytes is left"""
+        entries = sorted(self.entries(), key=os.path.getatime)
+        for path in entries:
+            if self.size <= self.max_bytes * 0.9:
+                break
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                self.size -= size
+            except OSError:
+                continue
+
+
+class TranscriptStore:
+    """
+    Keeps transcripts zlib-compressed in a temporary file so scraped rows
+    only hold an (offset, length) reference instead of the text.
+    """
+    
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.lock = threading.Lock()
+    
+    def add(self, text):
+        """Store a transcript, returns its (offset, length)"""
+        if not text:
+            return -1, 0
+        data = zlib.compress(text.encode('utf-8'))
+        with self.lock:
+            self.file.seek(0, os.SEEK_END)
+            offset = self.file.tell()
+            self.file.write(data)
+        return offset, len(data)
+    
+    def get(self, offset, length):
+        if offset < 0:
+            return ''
+        with self.lock:
+            self.file.seek(offset)
+            data = self.file.read(length)
+        return zlib.decompress(data).decode('utf-8')
+    
+    def close(self):
+        self.file.close()
+
+
+class VideoRecord:
+    """
+    Compact row for one scraped video. Counts are ints (-1 when unknown),
+    views_approximate marks rounded listing counts like '1.2M views',
+    channel strings are interned so rows of the same channel share them,
+    and the transcript lives in a TranscriptStore.
+    """
+    
+    COLUMNS = ['video_id', 'video_url', 'title', 'description', 'views',
+               'views_approximate', 'likes', 'comments', 'duration', 'upload_date', 'channel_name', 'channel_id',
+               'transcript', 'transcript_source']
+    
+    __slots__ = ('video_id', 'title', 'description', 'views', 'views_approximate',
+                 'likes', 'comments',
+                 'duration', 'upload_date', 'channel_name', 'channel_id',
+                 'transcript_source', 'transcript_store', 'transcript_offset',
+                 'transcript_length')
+    
+    def __init__(self, video_data, transcript_store):
+        self.video_id = video_data['video_id']
+        self.title = video_data.get('title') or ''
+        self.description = video_data.get('description') or ''
+        self.views = self.to_int(video_data.get('views'))
+        self.views_approximate = bool(video_data.get('views_approximate'))
+        self.likes = self.to_int(video_data.get('likes'))
+        self.comments = self.to_int(video_data.get('comments'))
+        self.duration = video_data.get('duration') or ''
+        self.upload_date = video_data.get('upload_date') or ''
+        self.channel_name = sys.intern(video_data.get('channel_name') or '')
+        self.channel_id = sys.intern(video_data.get('channel_id') or '')
+        self.transcript_source = sys.intern(video_data.get('transcript_source') or '')
+        self.transcript_store = transcript_store
+        self.transcript_offset, self.transcript_length = \
+            transcript_store.add(video_data.get('transcript'))
+    
+    @staticmethod
+    def to_int(value):
+        """Parse plain or comma-grouped counts (11356, '11,356'), -1 for anything else"""
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            value = value.strip()
+            if re.fullmatch(r'\d{1,3}(?:,\d{3})+|\d+', value):
+                return int(value.replace(',', ''))
+        return -1
+    
+    @property
+    def video_url(self):
+        return f"https://www.youtube.com/watch?v={self.video_id}"
+    
+    @property
+    def transcript(self):
+        return self.transcript_store.get(self.transcript_offset, self.transcript_length)
+    
+    def as_dict(self):
+        """Full output row, unknown counts as None"""
+        row = {col: getattr(self, col) for col in self.COLUMNS}
+        row['views_approximate'] = int(self.views_approximate)
+        for col in ('views', 'likes', 'comments'):
+            if row[col] < 0:
+                row[col] = None
+        return row
+
+
+# Adaptive concurrency for web requests
+CONCURRENCY_START = 4
+CONCURRENCY_MIN = 1
+CONCURRENCY_MAX = 16
+SLOW_LATENCY_FLOOR = 1.0  # seconds, faster responses never count as slow
+THROTTLE_EXCEPTIONS = ('TooManyRequests', 'RequestBlocked', 'IpBlocked')
+
+
+class ThrottledError(Exception):
+    """Raised when YouTube keeps answering with 429 or captcha pages"""
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on in-flight requests. The limit grows by one per window of
+    healthy responses, is halved on a throttling response and cut by a
+    quarter when latency climbs past twice the baseline, which also drifts
+    slowly towards slow samples so a lasting slowdown becomes the new normal.
+    Each kind of decrease happens at most once per second.
+    """
+    
+    def __init__(self, start=CONCURRENCY_START, minimum=CONCURRENCY_MIN,
+                 maximum=CONCURRENCY_MAX, on_change=None):
+        self.limit = float(start)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.on_change = on_change
+        self.in_flight = 0
+        self.baseline = None  # moving average of healthy latency
+        self.last_throttle = 0.0
+        self.last_slowdown = 0.0
+        self.requests = 0
+        self.throttle_events = 0
+        self.cond = threading.Condition()
+    
+    def acquire(self):
+        """Wait for a request slot, returns the start time"""
+        with self.cond:
+            while self.in_flight >= int(self.limit):
+                self.cond.wait()
+            self.in_flight += 1
+        return time.monotonic()
+    
+    def release(self, start, throttled=False, failed=False):
+        """Free a slot and adjust the limit from the outcome of the request"""
+        now = time.monotonic()
+        latency = now - start
+        reason = None
+        with self.cond:
+            self.in_flight -= 1
+            self.requests += 1
+            old = int(self.limit)
+            
+            if throttled:
+                self.throttle_events += 1
+                if now - self.last_throttle > 1.0:
+                    self.limit = max(self.minimum, self.limit / 2)
+                    self.last_throttle = now
+                reason = "throttled"
+            elif failed:
+                pass
+            elif self.baseline and latency > max(self.baseline * 2, SLOW_LATENCY_FLOOR):
+                if now - self.last_slowdown > 1.0:
+                    self.limit = max(self.minimum, self.limit * 0.75)
+                    self.last_slowdown = now
+                # Drift towards lasting slowdowns so the limit can recover
+                self.baseline = 0.98 * self.baseline + 0.02 * latency
+                reason = f"latency {latency:.1f}s"
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                self.baseline = latency if self.baseline is None else \
+                    0.9 * self.baseline + 0.1 * latency
+                reason = "healthy"
+            
+            new = int(self.limit)
+            self.cond.notify_all()
+        
+        if new != old and self.on_change:
+            self.on_change(old, new, reason)
+    
+    def metrics(self):
+        return {
+            'concurrency': int(self.limit),
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'throttle_events': self.throttle_events,
+            'baseline_latency': round(self.baseline or 0.0, 3),
+        }
+
+
+# Output files with these extensions are written to SQLite instead of CSV
+DATABASE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+
+class VideoDatabase:
+    """
+    SQLite sink for scraped data: videos keyed by video_id, channels keyed by
+    channel_id and a statistics snapshot per video per scrape. Rows are
+    buffered and upserted in batches, and the database runs in WAL mode so
+    readers never block the scrape.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS videos (
+            video_id TEXT PRIMARY KEY,
+            video_url TEXT,
+            title TEXT,
+            description TEXT,
+            views INTEGER,
+            views_approximate INTEGER,
+            likes INTEGER,
+            comments INTEGER,
+            duration TEXT,
+            upload_date TEXT,
+            channel_name TEXT,
+            channel_id TEXT,
+            transcript TEXT,
+            transcript_source TEXT,
+            last_scraped TEXT
+        );
+        CREATE TABLE IF NOT EXISTS channels (
+            channel_id TEXT PRIMARY KEY,
+            channel_name TEXT,
+            last_scraped TEXT
+        );
+        CREATE TABLE IF NOT EXISTS video_stats (
+            video_id TEXT NOT NULL,
+            captured_at TEXT NOT NULL,
+            views INTEGER,
+            likes INTEGER,
+            comments INTEGER,
+            PRIMARY KEY (video_id, captured_at)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_videos_channel_id ON videos (channel_id);
+        CREATE INDEX IF NOT EXISTS idx_videos_upload_date ON videos (upload_date);
+    """
+    
+    def __init__(self, path, batch_size=100):
+        self.batch_size = batch_size
+        self.pending = []
+        self.lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        
+        # Databases written before views_approximate existed
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(videos)")}
+        if 'views_approximate' not in existing:
+            with self.conn:
+                self.conn.execute("ALTER TABLE videos ADD COLUMN views_approximate INTEGER")
+        
+        # Unknown values (NULL counts, empty strings) never overwrite stored ones,
+        # and a rounded listing view count never replaces an exact one
+        columns = VideoRecord.COLUMNS + ['last_scraped']
+        keep_exact = ("excluded.views_approximate = 1 AND views IS NOT NULL "
+                      "AND COALESCE(views_approximate, 0) = 0")
+        updates = []
+        for col in columns[1:]:
+            if col == 'views':
+                updates.append(f"views=CASE WHEN {keep_exact} THEN views "
+                               f"ELSE COALESCE(excluded.views, views) END")
+            elif col == 'views_approximate':
+                updates.append(f"views_approximate=CASE WHEN {keep_exact} OR excluded.views IS NULL "
+                               f"THEN views_approximate ELSE excluded.views_approximate END")
+            elif col in ('likes', 'comments'):
+                updates.append(f"{col}=COALESCE(excluded.{col}, {col})")
+            else:
+                updates.append(f"{col}=COALESCE(NULLIF(excluded.{col}, ''), {col})")
+        updates = ", ".join(updates)
+        self.video_upsert = (
+            f"INSERT INTO videos ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(video_id) DO UPDATE SET {updates}"
+        )
+    
+    def add_video(self, record):
+        """Queue a VideoRecord, writing the batch once it is full"""
+        captured_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self.lock:
+            self.pending.append((record, captured_at))
+            full = len(self.pending) >= self.batch_size
+        if full:
+            self.flush()
+    
+    def flush(self):
+        """Upsert all queued rows in one transaction"""
+        with self.lock:
+            pending, self.pending = self.pending, []
+            if not pending:
+                return
+            
+            rows = [(record.as_dict(), captured_at) for record, captured_at in pending]
+            videos = [[data[col] for col in VideoRecord.COLUMNS] + [captured_at]
+                      for data, captured_at in rows]
+            channels = {data['channel_id']: (data['channel_id'], data['channel_name'], captured_at)
+                        for data, captured_at in rows if data['channel_id']}
+            stats = [(data['video_id'], captured_at, data['views'], data['likes'], data['comments'])
+                     for data, captured_at in rows if not data['views_approximate']]
+            
+            with self.conn:
+                self.conn.executemany(self.video_upsert, videos)
+                self.conn.executemany(
+                    "INSERT INTO channels (channel_id, channel_name, last_scraped) VALUES (?, ?, ?) "
+                    "ON CONFLICT(channel_id) DO UPDATE SET "
+                    "channel_name=COALESCE(NULLIF(excluded.channel_name, ''), channel_name), "
+                    "last_scraped=excluded.last_scraped",
+                    list(channels.values()))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO video_stats (video_id, captured_at, views, likes, comments) "
+                    "VALUES (?, ?, ?, ?, ?)", stats)
+    
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+# One fixed-size record per video per scrape (43 bytes), -1 = unknown
+SNAPSHOT_DTYPE = np.dtype([
+    ('video_id', 'S11'),
+    ('timestamp', '<i8'),  # unix seconds
+    ('views', '<i8'),
+    ('likes', '<i8'),
+    ('comments', '<i8'),
+])
+
+
+class StatsSnapshotStore:
+    """
+    Append-only log of (video_id, timestamp, views, likes, comments) records
+    kept as a flat binary array next to the output file. New scrapes only
+    append, and reads memory-map the file so growth queries run vectorized.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.pending = []
+        self.lock = threading.Lock()
+    
+    def add(self, video, timestamp=None):
+        """Queue a snapshot of a VideoRecord's statistics (skipped for rounded listing counts)"""
+        if video.views_approximate:
+            return
+        timestamp = int(timestamp or datetime.now(timezone.utc).timestamp())
+        record = (video.video_id.encode('ascii', 'ignore'), timestamp,
+                  video.views, video.likes, video.comments)
+        with self.lock:
+            self.pending.append(record)
+            full = len(self.pending) >= 1000
+        if full:
+            self.flush()
+    
+    def flush(self):
+        """Append queued snapshots to the file"""
+        with self.lock:
+            records, self.pending = self.pending, []
+        if records:
+            with open(self.path, 'ab') as f:
+                np.array(records, dtype=SNAPSHOT_DTYPE).tofile(f)
+    
+    def load(self):
+        """Memory-map all snapshots"""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < SNAPSHOT_DTYPE.itemsize:
+            return np.empty(0, dtype=SNAPSHOT_DTYPE)
+        count = os.path.getsize(self.path) // SNAPSHOT_DTYPE.itemsize
+        return np.memmap(self.path, dtype=SNAPSHOT_DTYPE, mode='r', shape=(count,))
+    
+    def growth_rates(self):
+        """Per-video growth per day between the first and last snapshot"""
+        data = self.load()
+        if len(data) == 0:
+            return pd.DataFrame()
+        
+        data = data[np.lexsort((data['timestamp'], data['video_id']))]
+        new_video = np.r_[True, data['video_id'][1:] != data['video_id'][:-1]]
+        first = np.flatnonzero(new_video)
+        last = np.r_[first[1:] - 1, len(data) - 1]
+        
+        days = (data['timestamp'][last] - data['timestamp'][first]) / 86400
+        days = np.where(days > 0, days, np.nan)
+        
+        result = {
+            'video_id': data['video_id'][first].astype(str),
+            'snapshots': last - first + 1,
+            'first_seen': pd.to_datetime(data['timestamp'][first], unit='s'),
+            'last_seen': pd.to_datetime(data['timestamp'][last], unit='s'),
+        }
+        for metric in ('views', 'likes', 'comments'):
+            start = data[metric][first].astype(float)
+            end = data[metric][last].astype(float)
+            start[start < 0] = np.nan
+            end[end < 0] = np.nan
+            result[metric] = end
+            result[f'{metric}_per_day'] = (end - start) / days
+        
+        return pd.DataFrame(result).sort_values('views_per_day', ascending=False)
+
 class YouTubeChannelScraper:
     def __init__(self, root):
         self.root = root
@@ -51,9 +689,45 @@ class YouTubeChannelScraper:
         self.output_file = tk.StringVar()
         self.is_scraping = False
         self.scrape_method = tk.StringVar(value="web")  # "web" or "api"
+        self.database = None  # VideoDatabase when writing to SQLite
+        self.transcript_store = None  # TranscriptStore for the current run
+        self.use_cache = tk.BooleanVar(value=False)
+        self.offline_mode = tk.BooleanVar(value=False)
+        self.response_cache = None  # ResponseCache while caching is on
         self.include_transcript = tk.BooleanVar(value=True)
+        self.include_shorts = tk.BooleanVar(value=True)  # also list /shorts and /streams
+        self.record_snapshots = tk.BooleanVar(value=False)
+        self.snapshots = None  # StatsSnapshotStore while snapshot mode is on
+        self.caption_languages = list(DEFAULT_CAPTION_LANGUAGES)
+        self.transcriber = tk.StringVar(value="auto")  # "auto" or a TRANSCRIPTION_BACKENDS key
+        self.transcription_backends = {}
+        
+        # Plain copies of the options above, taken by start_scraping so the
+        # scraping threads never read Tk variables
+        self.options = {}
+        
+        # Shared HTTP session (connection reuse across videos)
+        self.http_session = requests.Session()
+        self.http_session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Language': 'en-US,en;q=0.9'
+        })
+        
+        # Caption lookups run in the background while details are fetched,
+        # each caption thread with its own transcript API and HTTP session
+        self.caption_executor = ThreadPoolExecutor(max_workers=8)
+        self.caption_local = threading.local()
+        
+        # Limits in-flight YouTube requests, backing off when throttled
+        self.concurrency = AdaptiveConcurrency(on_change=self.on_concurrency_change)
+        self.whisper_lock = threading.Lock()  # one Whisper run at a time
+        
+        # Tk widgets are only touched from the main thread; other threads
+        # queue their log and progress updates
+        self.ui_queue = queue.Queue()
         
         self.setup_ui()
+        self.process_ui_queue()
         
     def setup_ui(self):
         # Main container
@@ -137,12 +811,32 @@ class YouTubeChannelScraper:
         ttk.Checkbutton(options_frame, text="Include Transcripts", 
                        variable=self.include_transcript).grid(row=0, column=2, padx=20)
         
+        # Include Shorts & Live tabs
+        ttk.Checkbutton(options_frame, text="Include Shorts & Live", 
+                       variable=self.include_shorts).grid(row=2, column=2, padx=20)
+        
         # Output Format
         ttk.Label(options_frame, text="Output Format:").grid(row=0, column=3, sticky=tk.W, padx=5)
         ttk.Radiobutton(options_frame, text="CSV", value="csv", 
                        variable=tk.StringVar(value="csv")).grid(row=0, column=4, padx=(0, 10))
         ttk.Radiobutton(options_frame, text="Excel", value="excel", 
                        variable=tk.StringVar(value="csv")).grid(row=0, column=5)
+        
+        # Snapshot mode
+        ttk.Checkbutton(options_frame, text="Record Stats Snapshots", 
+                       variable=self.record_snapshots).grid(row=1, column=2, padx=20)
+        
+        # Response cache
+        ttk.Checkbutton(options_frame, text="Cache Responses", 
+                       variable=self.use_cache).grid(row=1, column=3, padx=5)
+        ttk.Checkbutton(options_frame, text="Offline (Cache Only)", 
+                       variable=self.offline_mode).grid(row=1, column=4, columnspan=2, padx=5)
+        
+        # Whisper Engine
+        ttk.Label(options_frame, text="Whisper Engine:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        ttk.Combobox(options_frame, textvariable=self.transcriber, state="readonly", width=15,
+                     values=["auto"] + list(TRANSCRIPTION_BACKENDS)).grid(
+            row=1, column=1, sticky=tk.W, padx=5, pady=5)
         row += 1
         
         # Output File Section
@@ -176,6 +870,9 @@ class YouTubeChannelScraper:
         
         ttk.Button(button_frame, text="📊 Preview Data", 
                   command=self.preview_data).grid(row=0, column=3, padx=5)
+        
+        ttk.Button(button_frame, text="📈 Growth", 
+                  command=self.preview_growth).grid(row=0, column=4, padx=5)
         row += 1
         
         # Progress Section
@@ -238,32 +935,54 @@ class YouTubeChannelScraper:
     def browse_output_file(self):
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx"), ("All files", "*.*")],
+            filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx"),
+                       ("SQLite database", "*.db"), ("All files", "*.*")],
             initialfile="youtube_data.csv"
         )
         if filename:
             self.output_file.set(filename)
     
+    def run_on_ui(self, func, *args):
+        """Queue a widget update for the main thread (safe from any thread)"""
+        self.ui_queue.put((func, args))
+    
+    def process_ui_queue(self):
+        """Apply queued widget updates on the main thread, then poll again"""
+        try:
+            while True:
+                func, args = self.ui_queue.get_nowait()
+                func(*args)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(100, self.process_ui_queue)
+    
     def log_message(self, message, color="black"):
         timestamp = datetime.now().strftime("%H:%M:%S")
-        
+        self.run_on_ui(self.append_log, f"[{timestamp}] {message}\n", color)
+    
+    def append_log(self, line, color="black"):
         # Configure tag for color if needed
         if color != "black":
             self.log_text.tag_config(color, foreground=color)
         
         # Insert message
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n", color)
+        self.log_text.insert(tk.END, line, color)
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
     
     def update_progress(self, value, total=None):
         if total:
             percentage = int((value / total) * 100)
-            self.progress_var.set(percentage)
-            self.progress_label.config(text=f"Processing: {value}/{total} ({percentage}%)")
+            text = (f"Processing: {value}/{total} ({percentage}%) | "
+                    f"Concurrency: {int(self.concurrency.limit)}")
+            self.run_on_ui(self.show_progress, percentage, text)
         else:
-            self.progress_var.set(value)
-        self.root.update_idletasks()
+            self.run_on_ui(self.show_progress, value)
+    
+    def show_progress(self, percentage, text=None):
+        self.progress_var.set(percentage)
+        if text:
+            self.progress_label.config(text=text)
     
     def clear_logs(self):
         self.log_text.delete(1.0, tk.END)
@@ -279,52 +998,77 @@ class YouTubeChannelScraper:
         try:
             if output_file.endswith('.csv'):
                 df = pd.read_csv(output_file)
+            elif output_file.lower().endswith(DATABASE_EXTENSIONS):
+                with sqlite3.connect(output_file) as conn:
+                    df = pd.read_sql_query("SELECT * FROM videos ORDER BY upload_date DESC", conn)
             else:
                 df = pd.read_excel(output_file)
             
-            # Create preview window
-            preview = tk.Toplevel(self.root)
-            preview.title(f"Data Preview - {len(df)} rows")
-            preview.geometry("900x500")
-            
-            # Treeview for data
-            tree_frame = ttk.Frame(preview)
-            tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            # Scrollbars
-            vsb = ttk.Scrollbar(tree_frame, orient="vertical")
-            hsb = ttk.Scrollbar(tree_frame, orient="horizontal")
-            
-            # Treeview
-            tree = ttk.Treeview(tree_frame, yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-            vsb.config(command=tree.yview)
-            hsb.config(command=tree.xview)
-            
-            # Define columns
-            tree["columns"] = list(df.columns)
-            tree["show"] = "headings"
-            
-            # Set column headings
-            for col in df.columns:
-                tree.heading(col, text=col)
-                tree.column(col, width=100)
-            
-            # Add data
-            for i, row in df.head(50).iterrows():  # Show first 50 rows
-                tree.insert("", "end", values=list(row))
-            
-            tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            vsb.pack(side=tk.RIGHT, fill=tk.Y)
-            hsb.pack(side=tk.BOTTOM, fill=tk.X)
-            
-            # Info label
-            info_label = ttk.Label(preview, 
-                                 text=f"Showing {min(50, len(df))} of {len(df)} rows. Columns: {len(df.columns)}")
-            info_label.pack(pady=5)
+            self.show_dataframe(df, "Data Preview")
             
         except Exception as e:
             messagebox.showerror("Error", f"Could not preview data: {str(e)}")
     
+    def snapshot_path(self, output_file):
+        """Snapshot log that belongs to an output file"""
+        return os.path.splitext(output_file)[0] + ".snapshots"
+    
+    def preview_growth(self):
+        """Show view/like/comment growth from recorded snapshots"""
+        output_file = self.output_file.get()
+        path = self.snapshot_path(output_file) if output_file else ""
+        if not path or not os.path.exists(path):
+            messagebox.showinfo("Info", "No snapshots found. Scrape with 'Record Stats Snapshots' enabled.")
+            return
+        
+        try:
+            df = StatsSnapshotStore(path).growth_rates()
+            self.show_dataframe(df, "Growth")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not compute growth: {str(e)}")
+    
+    def show_dataframe(self, df, title):
+        """Show the first rows of a DataFrame in a new window"""
+        # Create preview window
+        preview = tk.Toplevel(self.root)
+        preview.title(f"{title} - {len(df)} rows")
+        preview.geometry("900x500")
+        
+        # Treeview for data
+        tree_frame = ttk.Frame(preview)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Scrollbars
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical")
+        hsb = ttk.Scrollbar(tree_frame, orient="horizontal")
+        
+        # Treeview
+        tree = ttk.Treeview(tree_frame, yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        vsb.config(command=tree.yview)
+        hsb.config(command=tree.xview)
+        
+        # Define columns
+        tree["columns"] = list(df.columns)
+        tree["show"] = "headings"
+        
+        # Set column headings
+        for col in df.columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=100)
+        
+        # Add data
+        for i, row in df.head(50).iterrows():  # Show first 50 rows
+            tree.insert("", "end", values=list(row))
+        
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        hsb.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Info label
+        info_label = ttk.Label(preview, 
+                             text=f"Showing {min(50, len(df))} of {len(df)} rows. Columns: {len(df.columns)}")
+        info_label.pack(pady=5)
+    
     def start_scraping(self):
         if not self.is_scraping:
             # Validate inputs
@@ -338,8 +1082,25 @@ class YouTubeChannelScraper:
                 messagebox.showerror("Error", "Please select an output file")
                 return
             
+            try:
+                max_videos = self.max_videos.get()
+            except tk.TclError:
+                messagebox.showerror("Error", "Max videos must be a whole number")
+                return
+            
+            self.options = {
+                'scrape_method': self.scrape_method.get(),
+                'max_videos': max_videos,
+                'use_cache': self.use_cache.get(),
+                'offline_mode': self.offline_mode.get(),
+                'include_transcript': self.include_transcript.get(),
+                'include_shorts': self.include_shorts.get(),
+                'record_snapshots': self.record_snapshots.get(),
+                'transcriber': self.transcriber.get(),
+            }
+            
             # Get API key if using API method
-            if self.scrape_method.get() == "api":
+            if self.options['scrape_method'] == "api":
                 self.api_key = self.api_key_entry.get().strip()
                 if not self.api_key and not YOUTUBE_API_AVAILABLE:
                     messagebox.showerror("Error", 
@@ -368,6 +1129,66 @@ class YouTubeChannelScraper:
     # Web Scraping Methods (No API Key Required)
     # ----------------------------------------------------------------------
     
+    def on_concurrency_change(self, old, new, reason):
+        color = "orange" if new < old else "gray"
+        self.log_message(f"🚦 Concurrency {old} → {new} ({reason})", color)
+    
+    def is_throttled(self, response):
+        """Detect 429s and captcha / 'unusual traffic' interstitials"""
+        if response.status_code == 429 or '/sorry/' in response.url:
+            return True
+        if 'ytInitialData' in response.text:
+            return False
+        text = response.text.lower()
+        return 'captcha' in text or 'unusual traffic' in text
+    
+    def throttled_call(self, func, *args):
+        """Run a request through the concurrency controller"""
+        start = self.concurrency.acquire()
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.concurrency.release(start, throttled=type(e).__name__ in THROTTLE_EXCEPTIONS,
+                                     failed=True)
+            raise
+        self.concurrency.release(start)
+        return result
+    
+    def fetch_page(self, url, endpoint, retries=3):
+        """
+        GET a page, going through the response cache when it is enabled.
+        Requests are limited by the concurrency controller and retried with
+        backoff when throttled.
+        """
+        cache = self.response_cache
+        if cache:
+            text = cache.get(endpoint, url)
+            if text is not None:
+                return text
+            if cache.offline:
+                raise CacheMiss(f"Not cached (offline mode): {url}")
+        
+        for attempt in range(retries):
+            start = self.concurrency.acquire()
+            try:
+                response = self.http_session.get(url, timeout=30)
+            except Exception:
+                self.concurrency.release(start, failed=True)
+                raise
+            throttled = self.is_throttled(response)
+            self.concurrency.release(start, throttled=throttled)
+            
+            if not throttled:
+                break
+            if attempt + 1 < retries:
+                time.sleep(2 ** (attempt + 1))
+        else:
+            raise ThrottledError(f"Throttled by YouTube: {url}")
+        
+        if cache and response.status_code == 200:
+            cache.put(endpoint, url, response.text)
+        return response.text
+    
     def extract_channel_id_web(self, url):
         """Extract channel ID from URL using web scraping"""
         try:
@@ -376,10 +1197,7 @@ class YouTubeChannelScraper:
                 return url.split('/channel/')[-1].split('/')[0].split('?')[0]
             elif '/c/' in url:
                 # For custom URLs, we need to get the actual channel ID
-                response = requests.get(url, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(self.fetch_page(url, 'channel_id'), 'html.parser')
                 
                 # Look for channel ID in meta tags or links
                 meta = soup.find('meta', {'itemprop': 'channelId'})
@@ -417,34 +1235,51 @@ class YouTubeChannelScraper:
         """Get videos from channel using web scraping"""
         videos = []
         try:
-            base_url = f"https://www.youtube.com/channel/{channel_id}/videos"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            tabs = LISTING_TABS if self.options['include_shorts'] else ('videos',)
             
-            response = requests.get(base_url, headers=headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Walk the channel tabs concurrently
+            with ThreadPoolExecutor(max_workers=len(tabs)) as executor:
+                listings = list(executor.map(lambda tab: self.get_tab_videos(channel_id, tab), tabs))
             
-            # Find video links
+            # Interleave the tabs newest-first so Shorts and streams still make
+            # the max_videos cut on channels with many uploads, dropping duplicates
+            seen = set()
             video_links = []
-            for link in soup.find_all('a', {'id': 'video-title-link'}):
-                href = link.get('href', '')
-                if '/watch?v=' in href:
-                    video_id = href.split('v=')[-1].split('&')[0]
-                    title = link.get('title', '') or link.text.strip()
-                    video_links.append({'video_id': video_id, 'title': title})
-            
-            # Get video details
-            for i, video in enumerate(video_links[:max_videos]):
-                if not self.is_scraping:
-                    break
-                    
-                self.update_progress(i + 1, max_videos)
-                self.log_message(f"Processing video {i+1}: {video['title'][:50]}...")
+            for rank in range(max(map(len, listings), default=0)):
+                for listing in listings:
+                    if rank < len(listing) and listing[rank]['video_id'] not in seen:
+                        seen.add(listing[rank]['video_id'])
+                        video_links.append(listing[rank])
+            
+            self.log_message(f"Found {len(video_links)} videos in tabs: {', '.join(tabs)}")
+            video_links = video_links[:max_videos]
+            
+            # Start caption lookups for the whole batch up front
+            captions = {}
+            if self.options['include_transcript']:
+                captions = self.prefetch_captions([video['video_id'] for video in video_links])
+            
+            # Get video details; the concurrency controller limits how
+            # many watch pages are actually requested at once
+            with ThreadPoolExecutor(max_workers=CONCURRENCY_MAX) as executor:
+                futures = [executor.submit(self.get_listing_video, video,
+                                           captions.get(video['video_id']))
+                           for video in video_links]
                 
-                video_data = self.get_video_details_web(video['video_id'])
-                if video_data:
-                    videos.append(video_data)
+                for i, (video, future) in enumerate(zip(video_links, futures)):
+                    if not self.is_scraping:
+                        for pending in futures:
+                            pending.cancel()
+                        self.cancel_captions(captions)
+                        break
+                    
+                    record = future.result()
+                    self.update_progress(i + 1, max_videos)
+                    self.log_message(f"Processed video {i+1}: {video['title'][:50]}...")
+                    
+                    if record:
+                        videos.append(record)
+                        self.store_video(record)
             
             return videos
             
@@ -452,31 +1287,150 @@ class YouTubeChannelScraper:
             self.log_message(f"Error getting videos: {str(e)}", "red")
             return videos
     
-    def get_video_details_web(self, video_id):
+    def get_tab_videos(self, channel_id, tab):
+        """
+        List the videos on one channel tab (videos, shorts or streams).
+        Returns dicts with video_id, title, views (None unless the listing
+        shows them), views_approximate, is_short, channel_name and channel_id.
+        """
+        try:
+            url = f"https://www.youtube.com/channel/{channel_id}/{tab}?hl=en"
+            soup = BeautifulSoup(self.fetch_page(url, 'channel_videos'), 'html.parser')
+        except Exception as e:
+            self.log_message(f"Could not load /{tab} tab: {str(e)}", "orange")
+            return []
+        
+        yt_data = self.extract_initial_data(soup) or {}
+        channel_name = (self.find_in_json(yt_data, 'channelMetadataRenderer') or {}).get('title', '')
+        
+        def entry(video_id, title, view_text=None, is_short=False):
+            views, approximate = self.parse_view_count(view_text) or (None, False)
+            return {'video_id': video_id, 'title': title or '', 'views': views,
+                    'views_approximate': approximate, 'is_short': is_short,
+                    'channel_name': channel_name, 'channel_id': channel_id}
+        
+        videos = []
+        
+        # Regular videos and streams
+        for renderer in self.find_all_in_json(yt_data, 'videoRenderer'):
+            if renderer.get('videoId'):
+                videos.append(entry(renderer['videoId'], self.get_text(renderer.get('title'))))
+        
+        # Shorts (older reel layout)
+        for renderer in self.find_all_in_json(yt_data, 'reelItemRenderer'):
+            if renderer.get('videoId'):
+                videos.append(entry(renderer['videoId'], self.get_text(renderer.get('headline')),
+                                    self.get_text(renderer.get('viewCountText')),
+                                    is_short=True))
+        
+        # Shorts (lockup view model layout)
+        for lockup in self.find_all_in_json(yt_data, 'shortsLockupViewModel'):
+            endpoint = self.find_in_json(lockup, 'reelWatchEndpoint') or {}
+            overlay = lockup.get('overlayMetadata', {})
+            if endpoint.get('videoId'):
+                videos.append(entry(endpoint['videoId'], self.get_text(overlay.get('primaryText')),
+                                    self.get_text(overlay.get('secondaryText')),
+                                    is_short=True))
+        
+        # Rendered HTML links, if any
+        for link in soup.find_all('a', {'id': 'video-title-link'}):
+            href = link.get('href', '')
+            if '/watch?v=' in href:
+                video_id = href.split('v=')[-1].split('&')[0]
+                videos.append(entry(video_id, link.get('title', '') or link.text.strip()))
+        
+        return videos
+    
+    def get_listing_video(self, video, caption_future=None):
+        """
+        Use listing metadata for Shorts when it has title and views, else the
+        watch page. Rounded listing counts are not logged as statistics, so
+        those Shorts also go to the watch page when snapshots or a database
+        are being written.
+        """
+        logging_stats = self.snapshots is not None or self.database is not None
+        if video['views_approximate'] and logging_stats:
+            return self.get_video_details_web(video['video_id'], caption_future)
+        if video['is_short'] and video['title'] and video['views'] is not None:
+            return self.get_short_from_listing(video, caption_future)
+        return self.get_video_details_web(video['video_id'], caption_future)
+    
+    def get_short_from_listing(self, video, caption_future=None):
+        """Build a Short's record from the /shorts listing without fetching its watch page"""
+        if not self.is_scraping:
+            return None
+        
+        video_data = {
+            'video_id': video['video_id'],
+            'title': video['title'],
+            'views': video['views'],
+            'views_approximate': video['views_approximate'],
+            'channel_name': video['channel_name'],
+            'channel_id': video['channel_id'],
+            'transcript': '',
+            'transcript_source': ''
+        }
+        
+        # Get transcript if requested
+        if self.options['include_transcript']:
+            try:
+                captions = caption_future.result() if caption_future else None
+                transcript, source = self.get_video_transcript(video['video_id'], captions)
+                video_data['transcript'] = transcript[:TRANSCRIPT_MAX_CHARS]
+                video_data['transcript_source'] = source
+            except:
+                video_data['transcript'] = "Not available"
+        
+        return VideoRecord(video_data, self.transcript_store)
+    
+    def parse_view_count(self, text):
+        """
+        Parse English listing view counts into (views, approximate):
+        '11,356 views' -> (11356, False), '1.2M views' -> (1200000, True).
+        Anything else returns None so the watch page is used instead.
+        """
+        match = re.fullmatch(r'(\d{1,3}(?:,\d{3})+|\d+)(\.\d+)?\s*([KMB])?\s+views?',
+                             (text or '').strip())
+        if not match or (match.group(2) and not match.group(3)):
+            return None
+        number = float(match.group(1).replace(',', '') + (match.group(2) or ''))
+        if not match.group(3):
+            return int(number), False
+        return int(number * {'K': 1e3, 'M': 1e6, 'B': 1e9}[match.group(3)]), True
+    
+    def get_text(self, value):
+        """Text of a YouTube text object (simpleText, runs or content)"""
+        if isinstance(value, dict):
+            if 'simpleText' in value:
+                return value['simpleText']
+            if 'runs' in value:
+                return ''.join(run.get('text', '') for run in value['runs'])
+            return value.get('content', '')
+        return value or ''
+    
+    def extract_initial_data(self, soup):
+        """Parse the ytInitialData JSON embedded in a YouTube page"""
+        for script in soup.find_all('script'):
+            if script.string and 'ytInitialData' in script.string:
+                try:
+                    start = script.string.find('{')
+                    end = script.string.rfind('}') + 1
+                    return json.loads(script.string[start:end])
+                except:
+                    continue
+        return None
+    
+    def get_video_details_web(self, video_id, caption_future=None):
         """Get video details by scraping video page"""
+        if not self.is_scraping:
+            return None
         try:
             url = f"https://www.youtube.com/watch?v={video_id}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
             
-            response = requests.get(url, headers=headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(self.fetch_page(url, 'watch'), 'html.parser')
             
             # Try to extract data from ytInitialData
-            scripts = soup.find_all('script')
-            yt_data = None
-            
-            for script in scripts:
-                if script.string and 'ytInitialData' in script.string:
-                    try:
-                        start = script.string.find('{')
-                        end = script.string.rfind('}') + 1
-                        json_str = script.string[start:end]
-                        yt_data = json.loads(json_str)
-                        break
-                    except:
-                        continue
+            yt_data = self.extract_initial_data(soup)
             
             if not yt_data:
                 return None
@@ -487,13 +1441,14 @@ class YouTubeChannelScraper:
                 'video_url': url,
                 'title': '',
                 'description': '',
-                'views': 0,
-                'likes': 0,
+                'views': None,
+                'likes': None,
                 'duration': '',
                 'upload_date': '',
                 'channel_name': '',
                 'channel_id': '',
-                'transcript': ''
+                'transcript': '',
+                'transcript_source': ''
             }
             
             # Try to navigate through the JSON structure
@@ -523,10 +1478,11 @@ class YouTubeChannelScraper:
                 if likes:
                     video_data['likes'] = int(likes) if str(likes).isdigit() else likes
                 
-                # Get upload date
+                # Get upload date (ISO, same format as the API's publishedAt)
                 date_text = self.find_in_json(video_details, 'dateText')
                 if date_text and 'simpleText' in date_text:
-                    video_data['upload_date'] = date_text['simpleText']
+                    date_text = date_text['simpleText']
+                video_data['upload_date'] = self.parse_upload_date(soup, date_text)
                 
                 # Get channel info
                 channel_info = self.find_in_json(yt_data, 'channelId') or \
@@ -538,23 +1494,71 @@ class YouTubeChannelScraper:
                     else:
                         video_data['channel_id'] = str(channel_info)
                 
+                # Get duration (ISO 8601, e.g. PT0M14S)
+                duration = soup.find('meta', {'itemprop': 'duration'})
+                if duration:
+                    video_data['duration'] = duration.get('content', '')
+                
                 # Get transcript if requested
-                if self.include_transcript.get():
+                if self.options['include_transcript']:
                     try:
-                        transcript = self.get_video_transcript(video_id)
-                        video_data['transcript'] = transcript[:5000]  # Limit length
+                        captions = caption_future.result() if caption_future else None
+                        transcript, source = self.get_video_transcript(video_id, captions,
+                                                                       video_data['duration'])
+                        video_data['transcript'] = transcript[:TRANSCRIPT_MAX_CHARS]  # Limit length
+                        video_data['transcript_source'] = source
                     except:
                         video_data['transcript'] = "Not available"
                 
             except Exception as e:
                 self.log_message(f"Error parsing video details: {str(e)}", "orange")
             
-            return video_data
+            return VideoRecord(video_data, self.transcript_store)
             
+        except ThrottledError:
+            self.log_message(f"🚦 Throttled by YouTube, skipped {video_id}", "orange")
+            return None
         except Exception as e:
             self.log_message(f"Error getting video details: {str(e)}", "red")
             return None
     
+    def parse_upload_date(self, soup, date_text=None):
+        """
+        Upload date of a watch page as ISO 8601, '' if unknown.
+        Prefers the uploadDate / datePublished meta tags; falls back to the
+        display text ("Dec 14, 2025", "Premiered Dec 14, 2025").
+        """
+        for prop in ('uploadDate', 'datePublished'):
+            meta = soup.find('meta', {'itemprop': prop})
+            if meta and meta.get('content'):
+                try:
+                    date = datetime.fromisoformat(meta['content'])
+                except ValueError:
+                    continue
+                if date.tzinfo is None:
+                    return date.date().isoformat()
+                return date.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        match = re.search(r'([A-Z][a-z]{2}) (\d{1,2}), (\d{4})', date_text or '')
+        if match:
+            try:
+                return datetime.strptime(' '.join(match.groups()), '%b %d %Y').date().isoformat()
+            except ValueError:
+                pass
+        return ''
+    
+    def find_all_in_json(self, data, target_key):
+        """Recursively yield every value stored under a key in JSON data"""
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key == target_key:
+                    yield value
+                else:
+                    yield from self.find_all_in_json(value, target_key)
+        elif isinstance(data, list):
+            for item in data:
+                yield from self.find_all_in_json(item, target_key)
+    
     def find_in_json(self, data, target_key, current_path=None):
         """Recursively search for a key in JSON data"""
         if current_path is None:
@@ -593,12 +1597,12 @@ class YouTubeChannelScraper:
                 # Try to get channel ID from custom URL
                 if '/@' in channel_url:
                     username = channel_url.split('/@')[-1].split('/')[0]
-                    search_response = youtube.search().list(
+                    search_response = self.api_execute(youtube.search().list(
                         q=username,
                         type='channel',
                         part='snippet',
                         maxResults=1
-                    ).execute()
+                    ), 'api_channel')
                     if search_response['items']:
                         channel_id = search_response['items'][0]['id']['channelId']
                     else:
@@ -609,10 +1613,10 @@ class YouTubeChannelScraper:
             self.log_message(f"Channel ID: {channel_id}", "green")
             
             # Get channel details
-            channel_response = youtube.channels().list(
+            channel_response = self.api_execute(youtube.channels().list(
                 id=channel_id,
                 part='snippet,statistics, contentDetails'
-            ).execute()
+            ), 'api_channel')
             
             channel_info = channel_response['items'][0]
             channel_name = channel_info['snippet']['title']
@@ -627,14 +1631,14 @@ class YouTubeChannelScraper:
             next_page_token = None
             total_processed = 0
             
-            while total_processed < self.max_videos.get() and self.is_scraping:
+            while total_processed < self.options['max_videos'] and self.is_scraping:
                 # Get video IDs from playlist
-                playlist_response = youtube.playlistItems().list(
+                playlist_response = self.api_execute(youtube.playlistItems().list(
                     playlistId=uploads_playlist_id,
                     part='contentDetails',
-                    maxResults=min(50, self.max_videos.get() - total_processed),
+                    maxResults=min(50, self.options['max_videos'] - total_processed),
                     pageToken=next_page_token
-                ).execute()
+                ), 'api_playlist')
                 
                 video_ids = [item['contentDetails']['videoId'] 
                            for item in playlist_response['items']]
@@ -649,26 +1653,35 @@ class YouTubeChannelScraper:
                     
                     batch = video_ids[i:i+50]
                     
-                    videos_response = youtube.videos().list(
+                    # Caption lookups run while the details request is in flight
+                    captions = {}
+                    if self.options['include_transcript']:
+                        captions = self.prefetch_captions(batch)
+                    
+                    videos_response = self.api_execute(youtube.videos().list(
                         id=','.join(batch),
                         part='snippet,statistics,contentDetails'
-                    ).execute()
+                    ), 'api_videos')
                     
                     for video in videos_response['items']:
                         if not self.is_scraping:
+                            self.cancel_captions(captions)
                             break
                         
-                        video_data = self.process_api_video(video, channel_name, channel_id)
-                        videos.append(video_data)
+                        record = self.process_api_video(video, channel_name, channel_id,
+                                                        captions.get(video['id']))
+                        videos.append(record)
+                        self.store_video(record)
                         total_processed += 1
                         
-                        self.update_progress(total_processed, self.max_videos.get())
-                        self.log_message(f"Processed: {video_data['title'][:50]}...")
+                        self.update_progress(total_processed, self.options['max_videos'])
+                        self.log_message(f"Processed: {record.title[:50]}...")
                         
-                        if total_processed >= self.max_videos.get():
+                        if total_processed >= self.options['max_videos']:
+                            self.cancel_captions(captions)
                             break
                     
-                    if total_processed >= self.max_videos.get():
+                    if total_processed >= self.options['max_videos']:
                         break
                 
                 next_page_token = playlist_response.get('nextPageToken')
@@ -681,68 +1694,307 @@ class YouTubeChannelScraper:
             self.log_message(f"API Error: {str(e)}", "red")
             return []
     
-    def process_api_video(self, video, channel_name, channel_id):
-        """Process video data from API response"""
+    def api_execute(self, request, endpoint):
+        """Execute a Data API request, going through the response cache when it is enabled"""
+        cache = self.response_cache
+        if not cache:
+            return request.execute()
+        
+        # Leave the API key out of the cache key
+        key = re.sub(r'([?&])key=[^&]*&?', r'\1', request.uri)
+        text = cache.get(endpoint, key)
+        if text is not None:
+            return json.loads(text)
+        if cache.offline:
+            raise CacheMiss(f"Not cached (offline mode): {key}")
+        
+        response = request.execute()
+        cache.put(endpoint, key, json.dumps(response))
+        return response
+    
+    def process_api_video(self, video, channel_name, channel_id, caption_future=None):
+        """Process video data from API response into a VideoRecord"""
         video_data = {
             'video_id': video['id'],
             'video_url': f"https://www.youtube.com/watch?v={video['id']}",
             'title': video['snippet']['title'],
             'description': video['snippet']['description'][:500],
-            'views': int(video['statistics'].get('viewCount', 0)),
-            'likes': int(video['statistics'].get('likeCount', 0)),
-            'comments': int(video['statistics'].get('commentCount', 0)),
+            # Hidden counts are left out of statistics and stay unknown
+            'views': video['statistics'].get('viewCount'),
+            'likes': video['statistics'].get('likeCount'),
+            'comments': video['statistics'].get('commentCount'),
             'duration': video['contentDetails']['duration'],
             'upload_date': video['snippet']['publishedAt'],
             'channel_name': channel_name,
             'channel_id': channel_id,
-            'transcript': ''
+            'transcript': '',
+            'transcript_source': ''
         }
         
         # Get transcript if requested
-        if self.include_transcript.get():
+        if self.options['include_transcript']:
             try:
-                transcript = self.get_video_transcript(video['id'])
-                video_data['transcript'] = transcript[:5000]
+                captions = caption_future.result() if caption_future else None
+                language = video['snippet'].get('defaultAudioLanguage') or \
+                          video['snippet'].get('defaultLanguage')
+                transcript, source = self.get_video_transcript(video['id'], captions,
+                                                               video_data['duration'], language)
+                video_data['transcript'] = transcript[:TRANSCRIPT_MAX_CHARS]
+                video_data['transcript_source'] = source
             except:
                 video_data['transcript'] = "Not available"
         
-        return video_data
+        return VideoRecord(video_data, self.transcript_store)
     
     # ----------------------------------------------------------------------
     # TRANSCRIPT METHODS
     # ----------------------------------------------------------------------
     
-    def get_video_transcript(self, video_id):
+    def get_transcript_list(self, video_id):
         """
-        Fetch transcript for a YouTube video.
-        1) Try manual captions
-        2) Try auto-generated captions
-        3) Fallback to Whisper audio transcription (works for Shorts)
+        List caption tracks. YouTubeTranscriptApi instances are not thread-safe
+        and rewrite their session's headers, so each thread builds one on its
+        own session and reuses it; the watch-page session is never shared.
         """
+        api = getattr(self.caption_local, 'api', None)
+        if api is None:
+            try:
+                # youtube-transcript-api >= 1.0 takes an http_client
+                api = YouTubeTranscriptApi(http_client=requests.Session())
+            except TypeError:
+                api = False  # older releases only have the static API
+            self.caption_local.api = api
+        if api is False:
+            return YouTubeTranscriptApi.list_transcripts(video_id)
+        return api.list(video_id)
+    
+    def get_video_captions(self, video_id, languages=None, max_chars=TRANSCRIPT_MAX_CHARS):
+        """
+        Fetch YouTube captions for a video as (text, source), ("", "") if
+        there are none, going through the response cache when it is enabled.
+        In offline mode an uncached video gets a "not cached" status.
+        """
+        if not TRANSCRIPT_AVAILABLE or not self.is_scraping:
+            return "", ""
         
-        # ---------- TRY YOUTUBE CAPTIONS ----------
-        if TRANSCRIPT_AVAILABLE:
+        languages = languages or self.caption_languages
+        cache = self.response_cache
+        key = f"{video_id}|{','.join(languages)}|{max_chars}"
+        if cache:
+            cached = cache.get('captions', key)
+            if cached is not None:
+                text, source = json.loads(cached)
+                return text, source
+            if cache.offline:
+                return "Transcript not cached (offline mode)", ""
+        
+        result = self.fetch_video_captions(video_id, languages, max_chars)
+        if result is None:
+            # Lookup failed, retry on the next run instead of caching
+            return "", ""
+        text, source = result
+        # Cache captions and "no captions", not status messages
+        if cache and (source or not text):
+            cache.put('captions', key, json.dumps([text, source]))
+        return text, source
+    
+    def fetch_video_captions(self, video_id, languages, max_chars=TRANSCRIPT_MAX_CHARS):
+        """
+        Download captions for a video as (text, source), ("", "") if it has
+        none, a status text with an empty source when YouTube throttles the
+        lookup, or None when the lookup failed for any other reason.
+        Looks up only the track that is needed: manual captions in a preferred
+        language, then auto-generated ones, then whatever track exists.
+        """
+        try:
+            transcript_list = self.throttled_call(self.get_transcript_list, video_id)
+        except Exception as e:
+            if type(e).__name__ in THROTTLE_EXCEPTIONS:
+                # Downloading audio from the same IP would be throttled too
+                return "Transcript unavailable (throttled by YouTube)", ""
+            if type(e).__name__ in NO_CAPTION_EXCEPTIONS:
+                return "", ""
+            return None
+        
+        transcript = None
+        for finder in (transcript_list.find_manually_created_transcript,
+                       transcript_list.find_generated_transcript):
             try:
-                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-
-                # Prefer manually created captions
-                for transcript in transcript_list:
-                    if not transcript.is_generated:
-                        return " ".join([item["text"] for item in transcript.fetch()])
-
-                # Fallback to auto-generated captions
-                for transcript in transcript_list:
-                    if transcript.is_generated:
-                        return " ".join([item["text"] for item in transcript.fetch()])
-
+                transcript = finder(languages)
+                break
+            except Exception:
+                continue
+        
+        if transcript is None:
+            # No track in a preferred language, take the first available
+            transcript = next(iter(transcript_list), None)
+            if transcript is None:
+                return "", ""
+        
+        try:
+            segments = self.throttled_call(transcript.fetch)
+        except Exception as e:
+            if type(e).__name__ in THROTTLE_EXCEPTIONS:
+                return "Transcript unavailable (throttled by YouTube)", ""
+            return None
+        
+        # Join segments until the length cap is reached
+        parts = []
+        length = 0
+        for item in segments:
+            text = item["text"] if isinstance(item, dict) else item.text
+            parts.append(text)
+            length += len(text) + 1
+            if length >= max_chars:
+                break
+        
+        source = f"captions:{transcript.language_code}"
+        if transcript.is_generated:
+            source += " (auto)"
+        return " ".join(parts)[:max_chars], source
+    
+    def prefetch_captions(self, video_ids):
+        """
+        Start caption lookups for a batch of videos, returns {video_id: Future}.
+        Callers cancel the futures with cancel_captions when scraping stops.
+        """
+        if not TRANSCRIPT_AVAILABLE:
+            return {}
+        return {video_id: self.caption_executor.submit(self.get_video_captions, video_id)
+                for video_id in video_ids}
+    
+    def cancel_captions(self, captions):
+        """Cancel caption lookups from prefetch_captions that have not started"""
+        for future in captions.values():
+            future.cancel()
+    
+    def parse_duration_seconds(self, duration):
+        """Convert an ISO 8601 duration (PT1M14S) or number to seconds, None if unknown"""
+        if not duration:
+            return None
+        if isinstance(duration, (int, float)):
+            return float(duration)
+        
+        if ISODATE_AVAILABLE:
+            try:
+                return isodate.parse_duration(duration).total_seconds()
             except Exception:
-                pass  # Continue to Whisper fallback
+                pass
+        
+        match = re.fullmatch(r'P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?', duration)
+        if not match:
+            return None
+        days, hours, minutes, seconds = (float(g) if g else 0 for g in match.groups())
+        return days * 86400 + hours * 3600 + minutes * 60 + seconds
+    
+    def detect_speech(self, audio, sample_rate=16000):
+        """
+        Find the span of the clip that contains speech.
+        Returns (start, end) sample indexes, or None if the clip is silent or,
+        when Silero VAD (bundled with faster-whisper) is installed, if speech
+        covers less than MIN_SPEECH_RATIO of it. Without Silero, music-only
+        clips are caught after the first Whisper pass instead (speech_ratio).
+        """
+        frame_len = int(sample_rate * 0.03)  # 30 ms frames
+        n_frames = len(audio) // frame_len
+        if n_frames == 0:
+            return None
+        
+        frames = audio[:n_frames * frame_len].reshape(n_frames, frame_len)
+        rms = np.sqrt(np.mean(frames ** 2, axis=1))
+        voiced = rms > SPEECH_ENERGY_THRESHOLD
+        if voiced.sum() * 0.03 < MIN_SPEECH_SECONDS:
+            return None
+        
+        pad = int(sample_rate * 0.25)
+        if SILERO_VAD_AVAILABLE:
+            timestamps = get_speech_timestamps(audio, VadOptions())
+            speech = sum(t['end'] - t['start'] for t in timestamps)
+            if speech / len(audio) < MIN_SPEECH_RATIO:
+                return None
+            start = max(0, timestamps[0]['start'] - pad)
+            end = min(len(audio), timestamps[-1]['end'] + pad)
+            return start, end
+        
+        # Keep a little context around the first and last loud frame
+        indexes = np.flatnonzero(voiced)
+        start = max(0, indexes[0] * frame_len - pad)
+        end = min(len(audio), (indexes[-1] + 1) * frame_len + pad)
+        return start, end
+    
+    def get_transcription_backend(self):
+        """Return the selected speech-to-text backend, None if none is installed"""
+        name = self.options['transcriber']
+        if name == "auto":
+            name = next((key for key, (_, available) in TRANSCRIPTION_BACKENDS.items()
+                         if available), None)
+        if name not in TRANSCRIPTION_BACKENDS or not TRANSCRIPTION_BACKENDS[name][1]:
+            return None
+        
+        if name not in self.transcription_backends:
+            # Only one backend (and so one loaded model) is kept at a time
+            self.transcription_backends = {name: TRANSCRIPTION_BACKENDS[name][0]()}
+        return self.transcription_backends[name]
+    
+    def select_model_tiers(self, seconds=None, language=None):
+        """
+        Pick the Whisper models to try, smallest first.
+        English clips use the .en models, other languages skip 'tiny' since
+        it is weak outside English, and long clips stop at the second tier.
+        """
+        tiers = list(WHISPER_MODEL_TIERS)
+        if language and not language.startswith('en'):
+            tiers = tiers[1:]
+        if seconds is not None and seconds > WHISPER_LONG_CLIP:
+            tiers = tiers[:2]
+        if language and language.startswith('en'):
+            tiers = [f"{tier}.en" for tier in tiers]
+        return tiers
+    
+    def load_audio(self, audio_path):
+        """Decode audio to 16 kHz mono float32"""
+        if WHISPER_AVAILABLE:
+            return whisper.load_audio(audio_path)
+        return decode_audio(audio_path, sampling_rate=16000)
+    
+    def get_video_transcript(self, video_id, captions=None, duration=None, language=None):
+        """
+        Fetch transcript for a YouTube video, returns (text, source).
+        1) Use prefetched captions if given
+        2) Try captions (manual first, then auto-generated)
+        3) Fallback to Whisper audio transcription (works for Shorts),
+           skipped for live, overly long and silent / music-only clips
+        """
+        
+        # ---------- TRY YOUTUBE CAPTIONS ----------
+        if captions is None:
+            captions = self.get_video_captions(video_id)
+        if captions[0]:
+            return captions
 
         # ---------- WHISPER FALLBACK (SHORTS SAFE) ----------
+        if self.response_cache and self.response_cache.offline:
+            return "Transcript not cached (offline mode)", ""
+        
+        seconds = self.parse_duration_seconds(duration)
+        if seconds is not None and seconds <= 0:
+            # P0D / PT0M0S: live or upcoming, there is no finished audio to fetch
+            return "Transcript skipped (live or upcoming video)", ""
+        if seconds is not None and seconds > WHISPER_MAX_DURATION:
+            return f"Transcript skipped (video longer than {WHISPER_MAX_DURATION // 60} min)", ""
+        
+        backend = self.get_transcription_backend()
+        if backend is None:
+            return "Transcript unavailable (no Whisper backend installed)", ""
+        
         try:
-            self.log_message(f"🎧 Transcribing audio with Whisper: {video_id}", "orange")
+            self.log_message(f"🎧 Transcribing audio with {backend.name}: {video_id}", "orange")
 
-            with tempfile.TemporaryDirectory() as tmp:
+            with self.whisper_lock, tempfile.TemporaryDirectory() as tmp:
+                # Stop may have been pressed while waiting for the lock
+                if not self.is_scraping:
+                    return "Transcript skipped (scraping stopped)", ""
+                
                 audio_path = os.path.join(tmp, "audio.mp3")
 
                 # Download audio using yt-dlp
@@ -752,6 +2004,8 @@ class YouTubeChannelScraper:
                         "-f", "bestaudio",
                         "-x",
                         "--audio-format", "mp3",
+                        "--match-filter", "!is_live",
+                        "--no-playlist",
                         "-o", audio_path,
                         f"https://www.youtube.com/watch?v={video_id}"
                     ],
@@ -760,32 +2014,78 @@ class YouTubeChannelScraper:
                 )
 
                 if not os.path.exists(audio_path):
-                    return "Transcript unavailable (audio download failed)"
+                    return "Transcript unavailable (audio download failed)", ""
 
-                # Transcribe with Whisper
-                model = whisper.load_model("base")
-                result = model.transcribe(audio_path)
-
-                return result.get("text", "Transcript unavailable")
+                # Skip Whisper for silent / music-only clips
+                audio = self.load_audio(audio_path)
+                span = self.detect_speech(audio)
+                if span is None:
+                    self.log_message(f"🔇 No speech detected, skipping Whisper: {video_id}", "orange")
+                    return "No speech detected (music or silent clip)", ""
+                
+                # Transcribe the speech span, escalating model size on low confidence
+                start, end = span
+                audio = audio[start:end].copy()  # release the rest of the clip
+                if language:
+                    language = language.split('-')[0]
+                best = None  # (confidence, text, model_name)
+                for tier, model_name in enumerate(self.select_model_tiers(seconds, language)):
+                    text, confidence, speech = backend.transcribe(audio, model_name, language)
+                    if tier == 0 and speech < MIN_SPEECH_RATIO:
+                        # The first pass doubles as the speech / music check
+                        self.log_message(f"🔇 No speech detected by {model_name}: {video_id}", "orange")
+                        return "No speech detected (music or silent clip)", f"{backend.name}:{model_name}"
+                    if best is None or confidence > best[0]:
+                        best = (confidence, text, model_name)
+                    if confidence >= WHISPER_MIN_CONFIDENCE:
+                        break
+                    self.log_message(f"Low confidence ({confidence:.2f}) with {model_name}: {video_id}", "orange")
+                
+                # Keep the highest-scoring tier, not necessarily the last one tried
+                confidence, text, model_name = best
+                return text or "Transcript unavailable", f"{backend.name}:{model_name}"
 
         except Exception as e:
-            return f"Transcript unavailable: {str(e)}"
+            return f"Transcript unavailable: {str(e)}", ""
     
     # ----------------------------------------------------------------------
     # Main Scraping Function
     # ----------------------------------------------------------------------
     
+    def store_video(self, record):
+        """Write a scraped video to the database sink and snapshot log, if open"""
+        if self.database:
+            self.database.add_video(record)
+        if self.snapshots:
+            self.snapshots.add(record)
+    
     def scrape_channel(self, channel_url, output_file):
         """Main scraping function"""
         try:
             self.log_message("Starting YouTube Channel Scraper...", "green")
             self.log_message(f"URL: {channel_url}")
-            self.log_message(f"Method: {self.scrape_method.get().upper()}")
-            self.log_message(f"Max Videos: {self.max_videos.get()}")
+            self.log_message(f"Method: {self.options['scrape_method'].upper()}")
+            self.log_message(f"Max Videos: {self.options['max_videos']}")
             
             videos = []
+            self.transcript_store = TranscriptStore()
+            self.concurrency = AdaptiveConcurrency(on_change=self.on_concurrency_change)
             
-            if self.scrape_method.get() == "api" and self.api_key and YOUTUBE_API_AVAILABLE:
+            if self.options['use_cache'] or self.options['offline_mode']:
+                self.response_cache = ResponseCache(offline=self.options['offline_mode'])
+                mode = "offline, cache only" if self.options['offline_mode'] else "cache enabled"
+                self.log_message(f"Response cache: {self.response_cache.directory} ({mode})", "blue")
+            
+            # Database output is written as videos come in
+            if output_file.lower().endswith(DATABASE_EXTENSIONS):
+                self.database = VideoDatabase(output_file)
+                self.log_message(f"Writing to SQLite database: {output_file}", "blue")
+            
+            if self.options['record_snapshots']:
+                self.snapshots = StatsSnapshotStore(self.snapshot_path(output_file))
+                self.log_message(f"Recording stats snapshots: {self.snapshots.path}", "blue")
+            
+            if self.options['scrape_method'] == "api" and self.api_key and YOUTUBE_API_AVAILABLE:
                 self.log_message("Using YouTube Data API...", "blue")
                 videos = self.scrape_with_api(channel_url, output_file)
             else:
@@ -796,30 +2096,49 @@ class YouTubeChannelScraper:
                     raise ValueError("Could not extract channel ID from URL")
                 
                 self.log_message(f"Found Channel ID: {channel_id}", "green")
-                videos = self.get_channel_videos_web(channel_id, self.max_videos.get())
+                videos = self.get_channel_videos_web(channel_id, self.options['max_videos'])
             
-            # Save to CSV
-            if videos and self.is_scraping:
-                self.log_message(f"Saving {len(videos)} videos to CSV...", "green")
+            metrics = self.concurrency.metrics()
+            self.log_message(f"🚦 Requests: {metrics['requests']}, throttle events: "
+                             f"{metrics['throttle_events']}, final concurrency: {metrics['concurrency']}",
+                             "blue")
+            
+            # Save to database / CSV
+            if videos and self.is_scraping and self.database:
+                self.database.flush()
                 
-                df = pd.DataFrame(videos)
+                self.log_message("✅ Data saved successfully!", "green")
+                self.log_message(f"🗄 Database: {output_file}", "green")
+                self.log_message(f"📊 Total videos: {len(videos)}", "green")
+                
+                self.run_on_ui(messagebox.showinfo, "Success", 
+                    f"✅ Successfully scraped {len(videos)} videos\n"
+                    f"🗄 Saved to: {output_file}")
+                
+            elif videos and self.is_scraping:
+                self.log_message(f"Saving {len(videos)} videos to CSV...", "green")
                 
                 # Ensure output file has .csv extension
                 if not output_file.lower().endswith('.csv'):
                     output_file += '.csv'
                 
-                df.to_csv(output_file, index=False, encoding='utf-8-sig')
+                # Write row by row so transcripts are only loaded one at a time
+                with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
+                    writer = csv.DictWriter(f, fieldnames=VideoRecord.COLUMNS)
+                    writer.writeheader()
+                    for record in videos:
+                        writer.writerow(record.as_dict())
                 
                 self.log_message(f"✅ Data saved successfully!", "green")
                 self.log_message(f"📁 File: {output_file}", "green")
                 self.log_message(f"📊 Total videos: {len(videos)}", "green")
-                self.log_message(f"📋 Columns: {', '.join(df.columns)}", "green")
+                self.log_message(f"📋 Columns: {', '.join(VideoRecord.COLUMNS)}", "green")
                 
                 # Show summary
-                messagebox.showinfo("Success", 
+                self.run_on_ui(messagebox.showinfo, "Success", 
                     f"✅ Successfully scraped {len(videos)} videos\n"
                     f"📁 Saved to: {output_file}\n"
-                    f"📊 Columns: {len(df.columns)}")
+                    f"📊 Columns: {len(VideoRecord.COLUMNS)}")
                 
             elif not self.is_scraping:
                 self.log_message("Scraping stopped by user", "orange")
@@ -828,9 +2147,20 @@ class YouTubeChannelScraper:
             
         except Exception as e:
             self.log_message(f"❌ Error during scraping: {str(e)}", "red")
-            messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
+            self.run_on_ui(messagebox.showerror, "Error", f"An error occurred:\n{str(e)}")
         finally:
-            self.on_scraping_finished()
+            self.is_scraping = False
+            if self.database:
+                self.database.close()
+                self.database = None
+            if self.snapshots:
+                self.snapshots.flush()
+                self.snapshots = None
+            self.response_cache = None
+            if self.transcript_store:
+                self.transcript_store.close()
+                self.transcript_store = None
+            self.run_on_ui(self.on_scraping_finished)
     
     def on_scraping_finished(self):
         """Clean up after scraping"""